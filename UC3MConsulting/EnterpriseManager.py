@@ -4,9 +4,121 @@ functionality for managing enterprise data and validating Spanish
 Tax Identification Numbers (CIF).
 """
 import json
+import os
+from functools import lru_cache
+from operator import itemgetter
 from .EnterpriseManagementException import EnterpriseManagementException
 from .EnterpriseRequest import EnterpriseRequest
 
+# Keys every enterprise JSON file must provide, extracted together in one call
+_ENTERPRISE_KEYS = ("cif", "phone", "enterprise_name")
+_ENTERPRISE_FIELDS = itemgetter(*_ENTERPRISE_KEYS)
+
+# Clearing this bit turns an ASCII lowercase letter into its uppercase letter
+_UPPER_MASK = 0xDF
+# Organization letters (ASCII codes) whose control character is the base digit
+_BASE_LETTERS = frozenset(b"ABEH")
+# Organization letters (ASCII codes) whose control character is a mapped letter
+_LETTER_LETTERS = frozenset(b"KPQS")
+# Kind of control character for each organization letter, indexed by ASCII code
+_INVALID_LETTER, _DIGIT_CONTROL, _LETTER_CONTROL = 0, 1, 2
+_LETTER_KIND = bytes(_DIGIT_CONTROL if c in _BASE_LETTERS
+                     else _LETTER_CONTROL if c in _LETTER_LETTERS
+                     else _INVALID_LETTER for c in range(256))
+# ASCII code of the control letter for each base digit, indexed by base digit
+_CONTROL_MAP = b"JABCDEFGHI"
+# Digit doubled with its two digits added back together, indexed by digit
+_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+# Number of distinct CIF validation results kept in memory
+_CIF_CACHE_SIZE = 4096
+# Number of files whose enterprise fields ReadProductCodeFromJSON keeps in memory
+_FILE_CACHE_SIZE = 256
+
+
+def _cif_base_digit(encoded):
+    """
+        Computes the CIF base digit from the ASCII bytes of a CIF whose
+        central block is already known to be 7 digits.
+    """
+    # Indexing the bytes gives ints directly, each digit is its byte minus 48
+    # Step 1: Add digits in even positions of the 7-digit block [cite: 30]
+    # (block indices 1, 3, 5, which are encoded[2], encoded[4], encoded[6])
+    even_sum = encoded[2] + encoded[4] + encoded[6] - 3 * 48
+
+    # Step 2: Process odd positions of the 7-digit block [cite: 31]
+    # (block indices 0, 2, 4, 6, which are encoded[1], [3], [5], [7])
+    # Doubling and adding the two digits (e.g., 16 -> 1+6=7) is read
+    # from the _DOUBLED table [cite: 35]
+    odd_sum = (_DOUBLED[encoded[1] - 48] + _DOUBLED[encoded[3] - 48]
+               + _DOUBLED[encoded[5] - 48] + _DOUBLED[encoded[7] - 48])
+
+    # Step 3: Total Sum [cite: 36]
+    total_sum = even_sum + odd_sum
+
+    # Step 4: Base Digit calculation [cite: 37]
+    unit_digit = total_sum % 10
+    return 0 if unit_digit == 0 else 10 - unit_digit
+
+
+def _validate_cif(cif):
+    """
+        Validates a Spanish CIF code based on official organization rules.
+        Results for string CIFs are cached, as they depend only on the string.
+    """
+    # Basic format check: Must be a 9 character ASCII string [cite: 23]
+    if not isinstance(cif, str) or len(cif) != 9 or not cif.isascii():
+        return False
+    return _validate_cif_cached(cif)
+
+
+@lru_cache(maxsize=_CIF_CACHE_SIZE)
+def _validate_cif_cached(cif):
+    """
+        Validates a 9 character CIF string, see _validate_cif.
+    """
+    # Work on the raw ASCII bytes: each digit is its byte minus 0x30
+    encoded = cif.encode("ascii")
+
+    # Organization letter, compared uppercased: only ASCII letters
+    # land in 'A'..'Z' once the lowercase bit is cleared
+    kind = _LETTER_KIND[encoded[0] & _UPPER_MASK]
+    if kind == _INVALID_LETTER:
+        return False
+
+    # Ensure the central body is 7 digits [cite: 26]
+    if not encoded[1:8].isdigit():
+        return False
+
+    base_digit = _cif_base_digit(encoded)
+
+    # Step 5: Determination of control character [cite: 38]
+    # For A, B, E, H: control is the base digit [cite: 39]
+    if kind == _DIGIT_CONTROL:
+        return encoded[8] == 48 + base_digit
+
+    # For K, P, Q, S: control is a letter from the mapping table [cite: 40]
+    return encoded[8] & _UPPER_MASK == _CONTROL_MAP[base_digit]
+
+
+@lru_cache(maxsize=_FILE_CACHE_SIZE)
+def _load_enterprise_fields(fi, mtime_ns, size):  # pylint: disable=unused-argument
+    """
+        Reads a JSON file and returns its (cif, phone, enterprise_name) values,
+        only this tuple is cached, not the parsed document.
+    """
+    # The modification time and size are part of the cache key, so a changed
+    # file is read again. On filesystems with coarse timestamps, a rewrite that
+    # keeps the same size within one timestamp tick is not seen and the old
+    # values are returned.
+    with open(fi, "rb") as f:
+        # Decoded as strict UTF-8, as the baseline text-mode read did
+        data = json.loads(f.read().decode("utf-8"))
+    try:
+        return _ENTERPRISE_FIELDS(data)
+    except (KeyError, TypeError) as e:
+        raise EnterpriseManagementException("Invalid JSON Key") from e
+
+
 class EnterpriseManager:
     """
     EnterpriseManager handles the business logic for enterprise
@@ -23,52 +135,16 @@ class EnterpriseManager:
             :param CIF_VAL: A 9-character string representing the CIF to validate.
             :return: True if the CIF follows the calculation rules, False otherwise.
         """
-        # Basic format check: Must be 9 characters [cite: 23]
-        if not cif or len(cif) != 9:
-            return False
-
-        letter = cif[0].upper()
-        block_of_numbers = cif[1:8]
-        control_char = cif[8].upper()
-
-        # Ensure the central body is 7 digits [cite: 26]
-        if not block_of_numbers.isdigit():
-            return False
-
-        # Step 1: Add digits in even positions (indices 1, 3, 5) [cite: 30]
-        even_sum = sum(int(block_of_numbers[i]) for i in [1, 3, 5])
-
-        # Step 2: Process odd positions (indices 0, 2, 4, 6) [cite: 31]
-        odd_sum = 0
-        for i in [0, 2, 4, 6]:
-            digit = int(block_of_numbers[i])
-            multiplied = digit * 2
-            # If result is two digits, add them (e.g., 16 -> 1+6=7) [cite: 35]
-            if multiplied > 9:
-                multiplied = (multiplied // 10) + (multiplied % 10)
-            odd_sum += multiplied
-
-        # Step 3: Total Sum [cite: 36]
-        total_sum = even_sum + odd_sum
-
-        # Step 4: Base Digit calculation [cite: 37]
-        unit_digit = total_sum % 10
-        base_digit = 0 if unit_digit == 0 else 10 - unit_digit
-
-        # Step 5: Determination of control character [cite: 38]
-        # For A, B, E, H: control is the base digit [cite: 39]
-        if letter in ['A', 'B', 'E', 'H']:
-            return control_char == str(base_digit)
-
-        # For K, P, Q, S: control is a letter from the mapping table [cite: 40]
-        if letter in ['K', 'P', 'Q', 'S']:
-            mapping = {
-                0: 'J', 1: 'A', 2: 'B', 3: 'C', 4: 'D',
-                5: 'E', 6: 'F', 7: 'G', 8: 'H', 9: 'I'
-            }
-            return control_char == mapping.get(base_digit)
+        return _validate_cif(cif)
 
-        return False
+    def ValidateManyCIF(self, cifs):
+        """
+            Validates a batch of Spanish CIF codes in a single call.
+
+            :param cifs: An iterable of CIF strings to validate.
+            :return: A list with the ValidateCIF result for each CIF, in order.
+        """
+        return list(map(_validate_cif, cifs))
 
     def ReadProductCodeFromJSON(self, fi):
         """
@@ -80,26 +156,30 @@ class EnterpriseManager:
                                                    validation fails.
         """
         try:
-            with open(fi, encoding="utf-8") as f:
-                data = json.load(f)
+            stat = os.stat(fi)
+            t_cif, t_phone, e_name = _load_enterprise_fields(fi, stat.st_mtime_ns,
+                                                             stat.st_size)
         except FileNotFoundError as e:
             raise EnterpriseManagementException("Wrong file or file path") from e
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise EnterpriseManagementException("Wrong JSON Format") from e
 
-        try:
-            t_cif = data["cif"]
-            t_phone = data["phone"]
-            e_name = data["enterprise_name"]
-            req = EnterpriseRequest(t_cif, t_phone, e_name)
-        except KeyError as e:
-            raise EnterpriseManagementException("Invalid JSON Key") from e
-
-        # Updated validation call and error message
+        # Validate before building the request, so invalid CIFs allocate nothing
         if not self.ValidateCIF(t_cif):
             raise EnterpriseManagementException("Invalid CIF format")
 
-        return req
+        return EnterpriseRequest(t_cif, t_phone, e_name)
+
+    def ReadManyProductCodesFromJSON(self, paths):
+        """
+            Parses several JSON files, one after another.
+
+            :param paths: An iterable of file system paths to JSON files.
+            :return: A list of EnterpriseRequest objects, in the order of paths.
+            :raises EnterpriseManagementException: If any file is invalid or
+                                                   validation fails.
+        """
+        return [self.ReadProductCodeFromJSON(path) for path in paths]
 
 # TASK 4: Verification Examples [cite: 79]
 if __name__ == "__main__":
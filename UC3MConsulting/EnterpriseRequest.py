@@ -4,38 +4,42 @@ import json
 
 class EnterpriseRequest:
     '''Enterprise request class'''
+    __slots__ = ('_cif', '_phone', '_enterprise_name')
+
     def __init__(self, cif, phone, e_name):
         '''Initialize enterprise request class'''
-        self.__enterprise_name = e_name
-        self.__cif = cif
-        self.__phone = phone
+        self._enterprise_name = e_name
+        self._cif = cif
+        self._phone = phone
 
     def __str__(self):
-        return "Enterprise:" + json.dumps(self.__dict__)
+        return "Enterprise:" + json.dumps({"enterprise_name": self._enterprise_name,
+                                           "cif": self._cif,
+                                           "phone": self._phone})
 
     @property
     def enterprise_cif(self):
         '''get CIF value'''
-        return self.__cif
+        return self._cif
     @enterprise_cif.setter
     def enterprise_cif(self, value):
         '''set CIF value'''
-        self.__cif = value
+        self._cif = value
 
     @property
     def phone_number(self):
         '''get phone number'''
-        return self.__phone
+        return self._phone
     @phone_number.setter
     def phone_number(self, value):
         '''set phone number'''
-        self.__phone = value
+        self._phone = value
 
     @property
     def enterprise_name(self):
         '''get enterprise name'''
-        return self.__enterprise_name
+        return self._enterprise_name
     @enterprise_name.setter
     def enterprise_name(self, value):
         '''set enterprise name'''
-        self.__enterprise_name = value
+        self._enterprise_name = value